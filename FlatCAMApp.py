@@ -746,10 +746,8 @@ class App(QtCore.QObject):
         :return: None
         """
 
-        if resource in self.defaults['stats']:
-            self.defaults['stats'][resource] += 1
-        else:
-            self.defaults['stats'][resource] = 1
+        stats = self.defaults['stats']
+        stats[resource] = stats.get(resource, 0) + 1
 
     # TODO: This shouldn't be here.
     class TclErrorException(Exception):
@@ -1594,6 +1592,12 @@ class App(QtCore.QObject):
         """
 
         xmin, ymin, xmax, ymax = self.collection.get_bounds()
+
+        # With no objects plotted the bounds are infinite; adjusting
+        # the axes to them would only trigger a useless redraw.
+        if xmin > xmax or ymin > ymax:
+            return
+
         width = xmax - xmin
         height = ymax - ymin
         xmin -= 0.05 * width
@@ -1620,17 +1624,15 @@ class App(QtCore.QObject):
         :return: None
         """
 
-        if event.key == self.defaults['fit_key']:  # 1
-            self.on_zoom_fit(None)
-            return
+        defaults = self.defaults
+        key = event.key
 
-        if event.key == self.defaults['zoom_out_key']:  # 2
-            self.plotcanvas.zoom(1 / self.defaults['zoom_ratio'], self.mouse)
-            return
-
-        if event.key == self.defaults['zoom_in_key']:  # 3
-            self.plotcanvas.zoom(self.defaults['zoom_ratio'], self.mouse)
-            return
+        if key == defaults['fit_key']:  # 1
+            self.on_zoom_fit(None)
+        elif key == defaults['zoom_out_key']:  # 2
+            self.plotcanvas.zoom(1 / defaults['zoom_ratio'], self.mouse)
+        elif key == defaults['zoom_in_key']:  # 3
+            self.plotcanvas.zoom(defaults['zoom_ratio'], self.mouse)
 
         # if event.key == 'm':
         #     if self.measure.toggle_active():
@@ -2353,10 +2355,14 @@ class App(QtCore.QObject):
             except ZeroDivisionError:
                 self.progress.emit(0)
                 return
+            # Adjusting the axes redraws the whole canvas, so suppress
+            # it while plotting the individual objects and do it only
+            # once when they are all on the figure.
             for obj in self.collection.get_list():
-                obj.plot()
+                obj.plot(auto_adjust=False)
                 percentage += delta
                 self.progress.emit(int(percentage*100))
+            self.plotcanvas.auto_adjust_axes()
 
             self.progress.emit(0)
             self.plots_updated.emit()
@@ -820,6 +820,10 @@ class FlatCAMDraw(QtCore.QObject):
         self.move_timer = QtCore.QTimer()
         self.move_timer.setSingleShot(True)
 
+        # Reusable artist for the snapped-pointer marker. Created on
+        # first use and updated in place on subsequent mouse moves.
+        self.snap_pointer = None
+
         self.key = None  # Currently pressed key
 
         def make_callback(thetool):
@@ -1084,8 +1088,13 @@ class FlatCAMDraw(QtCore.QObject):
         ### Snap coordinates
         x, y = self.snap(x, y)
 
+        # This runs once per mouse-move event; keep the attribute
+        # chains out of the loop bodies below.
+        axes = self.axes
+        mpl_canvas = self.canvas.canvas
+
         ### Utility geometry (animated)
-        self.canvas.canvas.restore_region(self.canvas.background)
+        mpl_canvas.restore_region(self.canvas.background)
         geo = self.active_tool.utility_geometry(data=(x, y))
 
         if isinstance(geo, DrawToolShape) and geo.geo is not None:
@@ -1104,15 +1113,20 @@ class FlatCAMDraw(QtCore.QObject):
                                        linewidth=1,
                                        animated=True)
             for el in elements:
-                self.axes.draw_artist(el)
+                axes.draw_artist(el)
             #self.canvas.canvas.blit(self.axes.bbox)
 
         # Pointer (snapped)
-        elements = self.axes.plot(x, y, 'bo', animated=True)
-        for el in elements:
-                self.axes.draw_artist(el)
+        # Calling axes.plot() here would allocate and attach a new
+        # artist on every mouse move. Create the marker once and only
+        # update its data afterwards.
+        if self.snap_pointer is None:
+            self.snap_pointer, = axes.plot(x, y, 'bo', animated=True)
+        else:
+            self.snap_pointer.set_data([x], [y])
+        axes.draw_artist(self.snap_pointer)
 
-        self.canvas.canvas.blit(self.axes.bbox)
+        mpl_canvas.blit(axes.bbox)
 
     def on_canvas_key(self, event):
         """
@@ -1274,6 +1288,9 @@ class FlatCAMDraw(QtCore.QObject):
         self.app.log.debug("plot_all()")
         self.axes.cla()
 
+        # The pointer marker was removed along with everything else.
+        self.snap_pointer = None
+
         for shape in self.storage.get_objects():
             if shape.geo is None:  # TODO: This shouldn't have happened
                 continue
@@ -1358,36 +1375,48 @@ class FlatCAMDraw(QtCore.QObject):
         :return: Snapped (x, y)
         """
 
+        # Runs on every mouse move. Fetch the options into locals once
+        # instead of probing the dict on each use.
+        options = self.options
+
         snap_x, snap_y = (x, y)
-        snap_distance = Inf
+
+        # Compare squared distances to avoid the sqrt on every event.
+        snap_distance_sq = Inf
 
         ### Object (corner?) snap
         ### No need for the objects, just the coordinates
         ### in the index.
-        if self.options["corner_snap"]:
+        if options["corner_snap"]:
             try:
                 nearest_pt, shape = self.storage.nearest((x, y))
 
-                nearest_pt_distance = distance((x, y), nearest_pt)
-                if nearest_pt_distance <= self.options["snap_max"]:
-                    snap_distance = nearest_pt_distance
+                dx = x - nearest_pt[0]
+                dy = y - nearest_pt[1]
+                nearest_pt_distance_sq = dx * dx + dy * dy
+                if nearest_pt_distance_sq <= options["snap_max"] ** 2:
+                    snap_distance_sq = nearest_pt_distance_sq
                     snap_x, snap_y = nearest_pt
             except (StopIteration, AssertionError):
                 pass
 
         ### Grid snap
-        if self.options["grid_snap"]:
-            if self.options["snap-x"] != 0:
-                snap_x_ = round(x / self.options["snap-x"]) * self.options['snap-x']
+        if options["grid_snap"]:
+            grid_x = options["snap-x"]
+            grid_y = options["snap-y"]
+
+            if grid_x != 0:
+                snap_x_ = round(x / grid_x) * grid_x
             else:
                 snap_x_ = x
 
-            if self.options["snap-y"] != 0:
-                snap_y_ = round(y / self.options["snap-y"]) * self.options['snap-y']
+            if grid_y != 0:
+                snap_y_ = round(y / grid_y) * grid_y
             else:
                 snap_y_ = y
-            nearest_grid_distance = distance((x, y), (snap_x_, snap_y_))
-            if nearest_grid_distance < snap_distance:
+            dx = x - snap_x_
+            dy = y - snap_y_
+            if dx * dx + dy * dy < snap_distance_sq:
                 snap_x, snap_y = (snap_x_, snap_y_)
 
         return snap_x, snap_y
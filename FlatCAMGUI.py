@@ -19,6 +19,12 @@ class FlatCAMGUI(QtGui.QMainWindow):
 
         # Divine icon pack by Ipapun @ finicons.com
 
+        # Icons used by several actions; constructed once and shared
+        # instead of being re-read per action.
+        folder_icon = QtGui.QIcon('share/folder16.png')
+        floppy_icon = QtGui.QIcon('share/floppy16.png')
+        clear_plot_icon = QtGui.QIcon('share/clear_plot16.png')
+
         ############
         ### Menu ###
         ############
@@ -32,55 +38,55 @@ class FlatCAMGUI(QtGui.QMainWindow):
         self.menufile.addAction(self.menufilenew)
 
         # Recent
-        self.recent = self.menufile.addMenu(QtGui.QIcon('share/folder16.png'), "Open recent ...")
+        self.recent = self.menufile.addMenu(folder_icon, "Open recent ...")
 
         # Separator
         self.menufile.addSeparator()
 
         # Open gerber ...
-        self.menufileopengerber = QtGui.QAction(QtGui.QIcon('share/folder16.png'), 'Open &Gerber ...', self)
+        self.menufileopengerber = QtGui.QAction(folder_icon, 'Open &Gerber ...', self)
         self.menufile.addAction(self.menufileopengerber)
 
         # Open Excellon ...
-        self.menufileopenexcellon = QtGui.QAction(QtGui.QIcon('share/folder16.png'), 'Open &Excellon ...', self)
+        self.menufileopenexcellon = QtGui.QAction(folder_icon, 'Open &Excellon ...', self)
         self.menufile.addAction(self.menufileopenexcellon)
 
         # Open G-Code ...
-        self.menufileopengcode = QtGui.QAction(QtGui.QIcon('share/folder16.png'), 'Open G-&Code ...', self)
+        self.menufileopengcode = QtGui.QAction(folder_icon, 'Open G-&Code ...', self)
         self.menufile.addAction(self.menufileopengcode)
 
         # Open Project ...
-        self.menufileopenproject = QtGui.QAction(QtGui.QIcon('share/folder16.png'), 'Open &Project ...', self)
+        self.menufileopenproject = QtGui.QAction(folder_icon, 'Open &Project ...', self)
         self.menufile.addAction(self.menufileopenproject)
 
         # Separator
         self.menufile.addSeparator()
 
         # Import SVG ...
-        self.menufileimportsvg = QtGui.QAction(QtGui.QIcon('share/folder16.png'), 'Import &SVG ...', self)
+        self.menufileimportsvg = QtGui.QAction(folder_icon, 'Import &SVG ...', self)
         self.menufile.addAction(self.menufileimportsvg)
 
         # Export SVG ...
-        self.menufileexportsvg = QtGui.QAction(QtGui.QIcon('share/folder16.png'), 'Export &SVG ...', self)
+        self.menufileexportsvg = QtGui.QAction(folder_icon, 'Export &SVG ...', self)
         self.menufile.addAction(self.menufileexportsvg)
 
         # Separator
         self.menufile.addSeparator()
 
         # Save Project
-        self.menufilesaveproject = QtGui.QAction(QtGui.QIcon('share/floppy16.png'), '&Save Project', self)
+        self.menufilesaveproject = QtGui.QAction(floppy_icon, '&Save Project', self)
         self.menufile.addAction(self.menufilesaveproject)
 
         # Save Project As ...
-        self.menufilesaveprojectas = QtGui.QAction(QtGui.QIcon('share/floppy16.png'), 'Save Project &As ...', self)
+        self.menufilesaveprojectas = QtGui.QAction(floppy_icon, 'Save Project &As ...', self)
         self.menufile.addAction(self.menufilesaveprojectas)
 
         # Save Project Copy ...
-        self.menufilesaveprojectcopy = QtGui.QAction(QtGui.QIcon('share/floppy16.png'), 'Save Project C&opy ...', self)
+        self.menufilesaveprojectcopy = QtGui.QAction(floppy_icon, 'Save Project C&opy ...', self)
         self.menufile.addAction(self.menufilesaveprojectcopy)
 
         # Save Defaults
-        self.menufilesavedefaults = QtGui.QAction(QtGui.QIcon('share/floppy16.png'), 'Save &Defaults', self)
+        self.menufilesavedefaults = QtGui.QAction(floppy_icon, 'Save &Defaults', self)
         self.menufile.addAction(self.menufilesavedefaults)
 
         # Separator
@@ -117,8 +123,8 @@ class FlatCAMGUI(QtGui.QMainWindow):
 
         ### View ###
         self.menuview = self.menu.addMenu('&View')
-        self.menuviewdisableall = self.menuview.addAction(QtGui.QIcon('share/clear_plot16.png'), 'Disable all plots')
-        self.menuviewdisableother = self.menuview.addAction(QtGui.QIcon('share/clear_plot16.png'),
+        self.menuviewdisableall = self.menuview.addAction(clear_plot_icon, 'Disable all plots')
+        self.menuviewdisableother = self.menuview.addAction(clear_plot_icon,
                                                             'Disable all plots but this one')
         self.menuviewenable = self.menuview.addAction(QtGui.QIcon('share/replot16.png'), 'Enable all plots')
 
@@ -212,8 +218,8 @@ class FlatCAMGUI(QtGui.QMainWindow):
         hlay1.addWidget(self.icon)
 
         self.options_combo = QtGui.QComboBox()
-        self.options_combo.addItem("APPLICATION DEFAULTS")
-        self.options_combo.addItem("PROJECT OPTIONS")
+        self.options_combo.addItems(["APPLICATION DEFAULTS",
+                                     "PROJECT OPTIONS"])
         hlay1.addWidget(self.options_combo)
         hlay1.addStretch()
 
@@ -228,11 +228,14 @@ class FlatCAMObj(QtCore.QObject):
         # box_selected.pack_start(sw, True, True, 0)
         # self.app.ui.notebook.selected_contents.add(self.ui)
         # self.app.ui.selected_layout.addWidget(self.ui)
-        try:
-            self.app.ui.selected_scroll_area.takeWidget()
-        except:
-            self.app.log.debug("Nothing to remove")
-        self.app.ui.selected_scroll_area.setWidget(self.ui)
+        # Skip the widget swap if this object's form is already
+        # installed; only the values need refreshing then.
+        if self.app.ui.selected_scroll_area.widget() is not self.ui:
+            try:
+                self.app.ui.selected_scroll_area.takeWidget()
+            except:
+                self.app.log.debug("Nothing to remove")
+            self.app.ui.selected_scroll_area.setWidget(self.ui)
         self.to_form()
 
         self.muted_ui = False
@@ -276,12 +279,16 @@ class FlatCAMObj(QtCore.QObject):
         # else:
         #     self.app.log.warning("Form fied does not exists: %s" % option)
 
-    def plot(self):
+    def plot(self, auto_adjust=True):
         """
         Plot this object (Extend this method to implement the actual plotting).
         Axes get created, appended to canvas and cleared before plotting.
         Call this in descendants before doing the plotting.
 
+        :param auto_adjust: Whether to re-adjust the axes (and re-draw the
+            whole canvas) after plotting. Pass False when plotting many
+            objects in a row and adjust once at the end.
+        :type auto_adjust: bool
         :return: Whether to continue plotting or not depending on the "plot" option.
         :rtype: bool
         """
@@ -293,7 +300,8 @@ class FlatCAMObj(QtCore.QObject):
 
         if not self.options["plot"]:
             self.axes.cla()
-            self.app.plotcanvas.auto_adjust_axes()
+            if auto_adjust:
+                self.app.plotcanvas.auto_adjust_axes()
             return False
 
         # Clear axes or we will plot on top of them.
@@ -477,7 +485,9 @@ class FlatCAMGerber(FlatCAMObj, Gerber):
                            [pts[6], pts[7], pts[8]],
                            [pts[9], pts[10], pts[11]]]}
             cuts = cases[self.options['gaps']]
-            geo_obj.solid_geometry = cascaded_union([LineString(segment) for segment in cuts])
+            # The segments are disjoint by construction; wrapping them in a
+            # MultiLineString avoids the GEOS union pass.
+            geo_obj.solid_geometry = MultiLineString(cuts)
 
         # TODO: Check for None
         self.app.new_object("geometry", name, geo_init)
@@ -623,13 +633,13 @@ class FlatCAMGerber(FlatCAMObj, Gerber):
         self.options['noncoppermargin'] *= factor
         self.options['bboxmargin'] *= factor
 
-    def plot(self):
+    def plot(self, auto_adjust=True):
 
         FlatCAMApp.App.log.debug(str(inspect.stack()[1][3]) + " --> FlatCAMGerber.plot()")
 
         # Does all the required setup and returns False
         # if the 'ptint' option is set to False.
-        if not FlatCAMObj.plot(self):
+        if not FlatCAMObj.plot(self, auto_adjust=auto_adjust):
             return
 
         geometry = self.solid_geometry
@@ -658,15 +668,39 @@ class FlatCAMGerber(FlatCAMObj, Gerber):
                 except AssertionError:
                     FlatCAMApp.App.log.warning("A geometry component was not a polygon:")
                     FlatCAMApp.App.log.warning(str(poly))
-        else:
+        elif self.options["multicolored"]:
+            # One artist per ring so each gets its own color from the
+            # color cycle.
             for poly in geometry:
                 x, y = poly.exterior.xy
                 self.axes.plot(x, y, linespec)
                 for ints in poly.interiors:
                     x, y = ints.coords.xy
                     self.axes.plot(x, y, linespec)
+        else:
+            # All rings have the same style, so draw them as a single
+            # artist: NaN separators make matplotlib break the line
+            # between rings. This keeps the artist count (and thus the
+            # per-redraw overhead) independent of the polygon count.
+            nan = float("nan")
+            xs = []
+            ys = []
+            for poly in geometry:
+                x, y = poly.exterior.xy
+                xs.extend(x)
+                xs.append(nan)
+                ys.extend(y)
+                ys.append(nan)
+                for ints in poly.interiors:
+                    x, y = ints.coords.xy
+                    xs.extend(x)
+                    xs.append(nan)
+                    ys.extend(y)
+                    ys.append(nan)
+            self.axes.plot(xs, ys, linespec)
 
-        self.app.plotcanvas.auto_adjust_axes()
+        if auto_adjust:
+            self.app.plotcanvas.auto_adjust_axes()
 
     def serialize(self):
         return {
@@ -1014,11 +1048,11 @@ class FlatCAMExcellon(FlatCAMObj, Excellon):
         self.options['travelz'] *= factor
         self.options['feedrate'] *= factor
 
-    def plot(self):
+    def plot(self, auto_adjust=True):
 
         # Does all the required setup and returns False
         # if the 'ptint' option is set to False.
-        if not FlatCAMObj.plot(self):
+        if not FlatCAMObj.plot(self, auto_adjust=auto_adjust):
             return
 
         try:
@@ -1036,14 +1070,32 @@ class FlatCAMExcellon(FlatCAMObj, Excellon):
                                      zorder=3)
                 self.axes.add_patch(patch)
         else:
+            # Batch all exteriors (and all interiors) into a single
+            # artist each, with NaN breaks between rings, instead of
+            # one artist per drill.
+            nan = float("nan")
+            ext_x = []
+            ext_y = []
+            int_x = []
+            int_y = []
             for geo in self.solid_geometry:
                 x, y = geo.exterior.coords.xy
-                self.axes.plot(x, y, 'r-')
+                ext_x.extend(x)
+                ext_x.append(nan)
+                ext_y.extend(y)
+                ext_y.append(nan)
                 for ints in geo.interiors:
                     x, y = ints.coords.xy
-                    self.axes.plot(x, y, 'g-')
-
-        self.app.plotcanvas.auto_adjust_axes()
+                    int_x.extend(x)
+                    int_x.append(nan)
+                    int_y.extend(y)
+                    int_y.append(nan)
+            self.axes.plot(ext_x, ext_y, 'r-')
+            if int_x:
+                self.axes.plot(int_x, int_y, 'g-')
+
+        if auto_adjust:
+            self.app.plotcanvas.auto_adjust_axes()
 
 
 class FlatCAMCNCjob(FlatCAMObj, CNCjob):
@@ -1197,16 +1249,17 @@ class FlatCAMCNCjob(FlatCAMObj, CNCjob):
         self.read_form_item('plot')
         self.plot()
 
-    def plot(self):
+    def plot(self, auto_adjust=True):
 
         # Does all the required setup and returns False
         # if the 'ptint' option is set to False.
-        if not FlatCAMObj.plot(self):
+        if not FlatCAMObj.plot(self, auto_adjust=auto_adjust):
             return
 
         self.plot2(self.axes, tooldia=self.options["tooldia"])
 
-        self.app.plotcanvas.auto_adjust_axes()
+        if auto_adjust:
+            self.app.plotcanvas.auto_adjust_axes()
 
     def convert_units(self, units):
         factor = CNCjob.convert_units(self, units)
@@ -1683,7 +1736,7 @@ class FlatCAMGeometry(FlatCAMObj, Geometry):
 
             FlatCAMApp.App.log.warning("Did not plot:" + str(type(element)))
 
-    def plot(self):
+    def plot(self, auto_adjust=True):
         """
         Plots the object into its axes. If None, of if the axes
         are not part of the app's figure, it fetches new ones.
@@ -1693,7 +1746,7 @@ class FlatCAMGeometry(FlatCAMObj, Geometry):
 
         # Does all the required setup and returns False
         # if the 'ptint' option is set to False.
-        if not FlatCAMObj.plot(self):
+        if not FlatCAMObj.plot(self, auto_adjust=auto_adjust):
             return
 
         # Make sure solid_geometry is iterable.
@@ -1734,4 +1787,5 @@ class FlatCAMGeometry(FlatCAMObj, Geometry):
 
         self.plot_element(self.solid_geometry)
 
-        self.app.plotcanvas.auto_adjust_axes()
+        if auto_adjust:
+            self.app.plotcanvas.auto_adjust_axes()
@@ -103,17 +103,19 @@ class LengthEntry(QtGui.QLineEdit):
         raw = str(self.text()).strip(' ')
         # match = self.format_re.search(raw)
 
+        # Resolve the optional unit suffix first, so the expression
+        # is evaluated once on a single path instead of being retried
+        # in each exception handler.
+        scale = 1.0
+        value = raw
         try:
-            units = raw[-2:]
-            units = self.scales[self.output_units][units.upper()]
+            scale = self.scales[self.output_units][raw[-2:].upper()]
             value = raw[:-2]
-            return float(eval(value))*units
-        except IndexError:
-            value = raw
-            return float(eval(value))
         except KeyError:
-            value = raw
-            return float(eval(value))
+            pass
+
+        try:
+            return float(eval(value)) * scale
         except:
             log.warning("Could not parse value in entry: %s" % str(raw))
             return None
@@ -44,18 +44,29 @@ class ObjectCollection():
         "geometry": "share:geometry16.png"
     }
 
+    # Pixmaps for the list view, loaded once on first use and shared
+    # by all instances. Lazy because QPixmap needs the QApplication.
+    icons = None
+
     def __init__(self, parent=None):
         #QtCore.QAbstractListModel.__init__(self, parent=parent)
 
         ### Icons for the list view
-        self.icons = {}
-        for kind in ObjectCollection.icon_files:
-            self.icons[kind] = QtGui.QPixmap(ObjectCollection.icon_files[kind])
+        if ObjectCollection.icons is None:
+            ObjectCollection.icons = {
+                kind: QtGui.QPixmap(filename)
+                for kind, filename in ObjectCollection.icon_files.items()
+            }
 
         ### Data ###
         self.object_list = []
         self.checked_indexes = []
 
+        # Memoized collection-wide bounds: (Geometry.change_epoch,
+        # bounds). Cleared when membership changes; geometry edits are
+        # detected through the epoch counter.
+        self._bounds_memo = None
+
         # Names of objects that are expected to become available.
         # For example, when the creation of a new object will run
         # in the background and will complete some time in the
@@ -159,6 +170,7 @@ class ObjectCollection():
 
         # Simply append to the python list
         self.object_list.append(obj)
+        self._bounds_memo = None
 
         # Create the model item to insert into the QListView
         icon = QtGui.QIcon(self.icons[obj.kind])#self.icons["gerber"])
@@ -218,22 +230,30 @@ class ObjectCollection():
 
         # TODO: Move the operation out of here.
 
-        xmin = Inf
-        ymin = Inf
-        xmax = -Inf
-        ymax = -Inf
+        # Serve repeated queries from the memo while no object has
+        # been added, removed or edited since it was taken.
+        if self._bounds_memo is not None and \
+                self._bounds_memo[0] == Geometry.change_epoch:
+            return self._bounds_memo[1]
 
+        # Stack the per-object bounding boxes (cheap since Geometry
+        # caches them) and reduce with numpy in one pass.
+        bboxes = []
         for obj in self.object_list:
             try:
-                gxmin, gymin, gxmax, gymax = obj.bounds()
-                xmin = min([xmin, gxmin])
-                ymin = min([ymin, gymin])
-                xmax = max([xmax, gxmax])
-                ymax = max([ymax, gymax])
+                bboxes.append(obj.bounds())
             except:
                 FlatCAMApp.App.log.warning("DEV WARNING: Tried to get bounds of empty geometry.")
 
-        return [xmin, ymin, xmax, ymax]
+        if not bboxes:
+            bounds = [Inf, Inf, -Inf, -Inf]
+        else:
+            arr = array(bboxes)
+            bounds = [arr[:, 0].min(), arr[:, 1].min(),
+                      arr[:, 2].max(), arr[:, 3].max()]
+
+        self._bounds_memo = (Geometry.change_epoch, bounds)
+        return bounds
 
     def get_by_name(self, name):
         """
@@ -261,6 +281,7 @@ class ObjectCollection():
 
         self.object_list.pop(row)
         self.model.removeRow(row)
+        self._bounds_memo = None
 
         #self.endRemoveRows()
 
@@ -313,8 +334,9 @@ class ObjectCollection():
 
         :return: None
         """
-        for name in self.get_names():
-            self.set_inactive(name)
+        # One call on the selection model instead of a per-object
+        # get_names()/index() round-trip for every entry in the list.
+        self.view.selectionModel().clearSelection()
 
     def on_list_selection_change(self, current, previous):
         FlatCAMApp.App.log.debug("on_list_selection_change()")
@@ -354,6 +376,7 @@ class ObjectCollection():
         self.model.removeRows(0, self.model.rowCount())
         self.object_list = []
         self.checked_indexes = []
+        self._bounds_memo = None
 
 #        self.endResetModel()
 
@@ -380,13 +380,13 @@ class PlotCanvas(QtCore.QObject):
     def pan(self, x, y):
         xmin, xmax = self.axes.get_xlim()
         ymin, ymax = self.axes.get_ylim()
-        width = xmax - xmin
-        height = ymax - ymin
+        dx = x * (xmax - xmin)
+        dy = y * (ymax - ymin)
 
         # Adjust axes
         for ax in self.figure.get_axes():
-            ax.set_xlim((xmin + x * width, xmax + x * width))
-            ax.set_ylim((ymin + y * height, ymax + y * height))
+            ax.set_xlim((xmin + dx, xmax + dx))
+            ax.set_ylim((ymin + dy, ymax + dy))
 
         # Re-draw
         self.canvas.draw_idle()
@@ -426,23 +426,20 @@ class PlotCanvas(QtCore.QObject):
                 self.zoom(1.5, self.mouse)
             else:
                 self.zoom(1 / 1.5, self.mouse)
-            return
 
-        if self.key == 'shift':
+        elif self.key == 'shift':
 
             if event.button == 'up':
                 self.pan(0.3, 0)
             else:
                 self.pan(-0.3, 0)
-            return
 
-        if self.key == 'control':
+        elif self.key == 'control':
 
             if event.button == 'up':
                 self.pan(0, 0.3)
             else:
                 self.pan(0, -0.3)
-            return
 
     def on_mouse_press(self, event):
 
@@ -470,6 +467,9 @@ class PlotCanvas(QtCore.QObject):
             # Clear pan flag
             self.panning = False
 
+            ##### Temporary place-holder for cached update #####
+            self.update_screen_request.emit([0, 0, 0, 0, 0])
+
     def on_mouse_move(self, event):
         """
         Mouse movement event hadler. Stores the coordinates. Updates view on pan.
@@ -485,11 +485,10 @@ class PlotCanvas(QtCore.QObject):
                 a.drag_pan(1, event.key, event.x, event.y)
 
             # Async re-draw (redraws only on thread idle state, uses timer on backend)
+            # The screen-update request is deferred to on_mouse_release so it
+            # fires once per pan instead of once per motion event.
             self.canvas.draw_idle()
 
-            ##### Temporary place-holder for cached update #####
-            self.update_screen_request.emit([0, 0, 0, 0, 0])
-
     def on_draw(self, renderer):
 
         # Store background on canvas redraw
@@ -10,7 +10,8 @@
 #import traceback
 
 from io import StringIO
-from numpy import arctan2, Inf, array, sqrt, pi, ceil, sin, cos, dot, float32, \
+from math import sqrt as scalar_sqrt
+from numpy import arange, arctan2, Inf, array, sqrt, pi, ceil, sin, cos, dot, float32, \
     transpose
 from numpy.linalg import solve, norm
 from matplotlib.figure import Figure
@@ -29,7 +30,7 @@ from rtree import index as rtindex
 
 # See: http://toblerity.org/shapely/manual.html
 from shapely.geometry import Polygon, LineString, Point, LinearRing
-from shapely.geometry import MultiPoint, MultiPolygon
+from shapely.geometry import MultiPoint, MultiPolygon, MultiLineString
 from shapely.geometry import box as shply_box
 from shapely.ops import cascaded_union, unary_union
 import shapely.affinity as affinity
@@ -37,6 +38,15 @@ from shapely.wkt import loads as sloads
 from shapely.wkt import dumps as sdumps
 from shapely.geometry.base import BaseGeometry
 
+# Speedups (C implementations of predicates and transforms) are not
+# available in every Shapely build; enable them when they are.
+try:
+    from shapely import speedups
+    if speedups.available:
+        speedups.enable()
+except ImportError:
+    pass
+
 # Used for solid polygons in Matplotlib
 from descartes.patch import PolygonPatch
 
@@ -48,10 +58,6 @@ import xml.etree.ElementTree as ET
 from svg.path import Path, Line, Arc, CubicBezier, QuadraticBezier, parse_path
 import itertools
 
-import xml.etree.ElementTree as ET
-from svg.path import Path, Line, Arc, CubicBezier, QuadraticBezier, parse_path
-
-
 from svgparse import *
 
 import logging
@@ -79,10 +85,26 @@ class Geometry(object):
         "init_units": 'in'
     }
 
+    # Scale factors for unit conversion, keyed by target unit.
+    unit_factors = {
+        "MM": 25.4,
+        "IN": 1 / 25.4
+    }
+
+    # Backing storage for the solid_geometry property and its
+    # cached bounds, in case they are read before __init__ runs.
+    _solid_geometry = None
+    _bounds_cache = None
+
+    # Bumped whenever any Geometry changes. Lets holders of
+    # aggregated results (e.g. collection-wide bounds) tell whether
+    # their memo is still valid.
+    change_epoch = 0
+
     def __init__(self):
         # Units (in or mm)
         self.units = Geometry.defaults["init_units"]
-        
+
         # Final geometry: MultiPolygon or list (of geometry constructs)
         self.solid_geometry = None
 
@@ -95,6 +117,20 @@ class Geometry(object):
         # Index
         self.index = None
 
+    @property
+    def solid_geometry(self):
+        return self._solid_geometry
+
+    @solid_geometry.setter
+    def solid_geometry(self, value):
+        self._solid_geometry = value
+
+        # Replacing the geometry invalidates the cached bounds.
+        # Methods that mutate the geometry list in place must clear
+        # the cache themselves.
+        self._bounds_cache = None
+        Geometry.change_epoch += 1
+
     def make_index(self):
         self.flatten()
         self.index = FlatCAMRTree()
@@ -117,6 +153,8 @@ class Geometry(object):
 
         if type(self.solid_geometry) is list:
             self.solid_geometry.append(Point(origin).buffer(radius))
+            self._bounds_cache = None
+            Geometry.change_epoch += 1
             return
 
         try:
@@ -138,6 +176,8 @@ class Geometry(object):
 
         if type(self.solid_geometry) is list:
             self.solid_geometry.append(Polygon(points))
+            self._bounds_cache = None
+            Geometry.change_epoch += 1
             return
 
         try:
@@ -159,6 +199,8 @@ class Geometry(object):
 
         if type(self.solid_geometry) is list:
             self.solid_geometry.append(LineString(points))
+            self._bounds_cache = None
+            Geometry.change_epoch += 1
             return
 
         try:
@@ -185,14 +227,26 @@ class Geometry(object):
         :param points: The vertices of the polygon.
         :return: none
         """
+
+        self.subtract_geometry(Polygon(points))
+
+    def subtract_geometry(self, toolgeo):
+        """
+        Subtract a Shapely geometry from the given object. This only
+        operates on the paths in the original geometry, i.e. it
+        converts polygons into paths. Callers with several shapes to
+        remove should union them and make a single call here, so the
+        geometry is flattened and re-assembled only once.
+
+        :param toolgeo: Shapely geometry to subtract.
+        :return: None
+        """
         if self.solid_geometry is None:
             self.solid_geometry = []
 
         #pathonly should be allways True, otherwise polygons are not subtracted
         flat_geometry = self.flatten(pathonly=True)
         log.debug("%d paths" % len(flat_geometry))
-        polygon=Polygon(points)
-        toolgeo=cascaded_union(polygon)
         diffs=[]
         for target in flat_geometry:
             if type(target) == LineString or type(target) == LinearRing:
@@ -207,18 +261,35 @@ class Geometry(object):
         of geometry: (xmin, ymin, xmax, ymax).
         """
         log.debug("Geometry->bounds()")
+
+        if self._bounds_cache is not None:
+            return self._bounds_cache
+
         if self.solid_geometry is None:
             log.debug("solid_geometry is None")
             return 0, 0, 0, 0
 
         if type(self.solid_geometry) is list:
-            # TODO: This can be done faster. See comment from Shapely mailing lists.
             if len(self.solid_geometry) == 0:
                 log.debug('solid_geometry is empty []')
                 return 0, 0, 0, 0
-            return cascaded_union(self.solid_geometry).bounds
+
+            # Take the union of the components' bounding boxes rather
+            # than of the geometry itself, which sidesteps the full
+            # union computation in GEOS.
+            xmin = ymin = Inf
+            xmax = ymax = -Inf
+            for geo in self.solid_geometry:
+                gxmin, gymin, gxmax, gymax = geo.bounds
+                xmin = min(xmin, gxmin)
+                ymin = min(ymin, gymin)
+                xmax = max(xmax, gxmax)
+                ymax = max(ymax, gymax)
+            self._bounds_cache = (xmin, ymin, xmax, ymax)
         else:
-            return self.solid_geometry.bounds
+            self._bounds_cache = self.solid_geometry.bounds
+
+        return self._bounds_cache
 
     def find_polygon(self, point, geoset=None):
         """
@@ -448,6 +519,8 @@ class Geometry(object):
                 self.solid_geometry += geos
             else:
                 self.solid_geometry.append(geos)
+                self._bounds_cache = None
+                Geometry.change_epoch += 1
         else:  # It's shapely geometry
             # self.solid_geometry = cascaded_union([self.solid_geometry,
             #                                       cascaded_union(geos)])
@@ -951,14 +1024,13 @@ class Geometry(object):
         """
         log.debug("Geometry.convert_units()")
 
-        if units.upper() == self.units.upper():
+        units_upper = units.upper()
+        if units_upper == self.units.upper():
             return 1.0
 
-        if units.upper() == "MM":
-            factor = 25.4
-        elif units.upper() == "IN":
-            factor = 1 / 25.4
-        else:
+        try:
+            factor = self.unit_factors[units_upper]
+        except KeyError:
             log.error("Unsupported units: %s" % str(units))
             return 1.0
 
@@ -2910,9 +2982,14 @@ class Excellon(Geometry):
 
         dx, dy = vect
 
-        # Drills
-        for drill in self.drills:
-            drill['point'] = affinity.translate(drill['point'], xoff=dx, yoff=dy)
+        # Drills. Translated as one MultiPoint, a single GEOS call
+        # instead of one per drill.
+        if self.drills:
+            moved = affinity.translate(
+                MultiPoint([drill['point'] for drill in self.drills]),
+                xoff=dx, yoff=dy)
+            for drill, point in zip(self.drills, moved.geoms):
+                drill['point'] = point
 
         # Recreate geometry
         self.create_geometry()
@@ -3025,6 +3102,12 @@ class CNCjob(Geometry):
         "coordinate_format": "X%.4fY%.4f"
     }
 
+    # Constant G-Code words. Shared by all instances, so they are
+    # not rebuilt on every job creation.
+    unitcode = {"IN": "G20", "MM": "G21"}
+    feedminutecode = "G94"
+    absolutecode = "G90"
+
     def __init__(self,
                  units="in",
                  kind="generic",
@@ -3042,11 +3125,8 @@ class CNCjob(Geometry):
         self.z_move = z_move
         self.feedrate = feedrate
         self.tooldia = tooldia
-        self.unitcode = {"IN": "G20", "MM": "G21"}
         # TODO: G04 Does not exist. It's G4 and now we are handling in postprocessing.
         #self.pausecode = "G04 P1"
-        self.feedminutecode = "G94"
-        self.absolutecode = "G90"
         self.gcode = ""
         self.input_geometry_bounds = None
         self.gcode_parsed = None
@@ -3061,6 +3141,12 @@ class CNCjob(Geometry):
 
         self.spindlespeed = spindlespeed
 
+        # Pre-built coordinate templates. Built once here instead of
+        # being re-concatenated on every (rapid/linear) move emitted.
+        coordinate_format = CNCjob.defaults["coordinate_format"]
+        self.rapid_template = "G00 " + coordinate_format + "\n"
+        self.move_template = "G0%d " + coordinate_format + "\n"
+
         # Attributes to be included in serialization
         # Always append to it because it carries contents
         # from Geometry.
@@ -3132,54 +3218,63 @@ class CNCjob(Geometry):
         self.gcode = []
 
         # Basic G-Code macros
-        t = "G00 " + CNCjob.defaults["coordinate_format"] + "\n"
+        t = self.rapid_template
         down = "G01 Z%.4f\n" % self.z_cut
         up = "G00 Z%.4f\n" % self.z_move
         up_to_zero = "G01 Z0\n"
 
-        # Initialization
-        gcode = self.unitcode[self.units.upper()] + "\n"
-        gcode += self.absolutecode + "\n"
-        gcode += self.feedminutecode + "\n"
-        gcode += "F%.2f\n" % self.feedrate
-        gcode += "G00 Z%.4f\n" % self.z_move  # Move to travel height
-
         if self.spindlespeed is not None:
             # Spindle start with configured speed
-            gcode += "M03 S%d\n" % int(self.spindlespeed)
+            spindle_start = "M03 S%d\n" % int(self.spindlespeed)
         else:
-            gcode += "M03\n"  # Spindle start
+            spindle_start = "M03\n"  # Spindle start
+
+        # Tool change sequence template. Only the tool slot and the
+        # diameter vary between changes, so the block is assembled once
+        # and formatted per tool instead of line by line.
+        toolchange_code = ("G00 Z%.4f\n" % toolchangez) + \
+                          "T%d\n" \
+                          "M5\n" \
+                          "M6\n" \
+                          "(MSG, Change to tool dia=%.4f)\n" \
+                          "M0\n" + \
+                          spindle_start
+
+        # The G-code is collected in a list and joined at the end;
+        # appending to a string re-copies it on every drill.
+        drill_cycle = down + up_to_zero + up
+
+        # Initialization
+        gcode = [self.unitcode[self.units.upper()] + "\n",
+                 self.absolutecode + "\n",
+                 self.feedminutecode + "\n",
+                 "F%.2f\n" % self.feedrate,
+                 "G00 Z%.4f\n" % self.z_move,  # Move to travel height
+                 spindle_start]
 
-        # gcode += self.pausecode + "\n"
+        # gcode.append(self.pausecode + "\n")
 
         for tool in tools:
 
             # Only if tool has points.
             if tool in points:
+                tool_points = points[tool]
+
                 # Tool change sequence (optional)
                 if toolchange:
-                    gcode += "G00 Z%.4f\n" % toolchangez
-                    gcode += "T%d\n" % int(tool)  # Indicate tool slot (for automatic tool changer)
-                    gcode += "M5\n"  # Spindle Stop
-                    gcode += "M6\n"  # Tool change
-                    gcode += "(MSG, Change to tool dia=%.4f)\n" % exobj.tools[tool]["C"]
-                    gcode += "M0\n"  # Temporary machine stop
-                    if self.spindlespeed is not None:
-                        # Spindle start with configured speed
-                        gcode += "M03 S%d\n" % int(self.spindlespeed)
-                    else:
-                        gcode += "M03\n"  # Spindle start
+                    gcode.append(toolchange_code % (int(tool),
+                                                    exobj.tools[tool]["C"]))
 
                 # Drillling!
-                for point in points[tool]:
+                for point in tool_points:
                     x, y = point.coords.xy
-                    gcode += t % (x[0], y[0])
-                    gcode += down + up_to_zero + up
+                    gcode.append(t % (x[0], y[0]))
+                    gcode.append(drill_cycle)
 
-        gcode += t % (0, 0)
-        gcode += "M05\n"  # Spindle stop
+        gcode.append(t % (0, 0))
+        gcode.append("M05\n")  # Spindle stop
 
-        self.gcode = gcode
+        self.gcode = "".join(gcode)
 
     def generate_from_geometry_2(self,
                                  geometry,
@@ -3237,20 +3332,26 @@ class CNCjob(Geometry):
         if not append:
             self.gcode = ""
 
+        # The G-code is collected in a list and joined at the end;
+        # appending to self.gcode re-copies the whole string per path.
         # Initial G-Code
-        self.gcode = self.unitcode[self.units.upper()] + "\n"
-        self.gcode += self.absolutecode + "\n"
-        self.gcode += self.feedminutecode + "\n"
-        self.gcode += "F%.2f\n" % self.feedrate
-        self.gcode += "G00 Z%.4f\n" % self.z_move  # Move (up) to travel height
+        gcode = [self.unitcode[self.units.upper()] + "\n",
+                 self.absolutecode + "\n",
+                 self.feedminutecode + "\n",
+                 "F%.2f\n" % self.feedrate,
+                 "G00 Z%.4f\n" % self.z_move]  # Move (up) to travel height
         if self.spindlespeed is not None:
-            self.gcode += "M03 S%d\n" % int(self.spindlespeed)  # Spindle start with configured speed
+            gcode.append("M03 S%d\n" % int(self.spindlespeed))  # Spindle start with configured speed
         else:
-            self.gcode += "M03\n"  # Spindle start
-        #self.gcode += self.pausecode + "\n"
+            gcode.append("M03\n")  # Spindle start
+        #gcode.append(self.pausecode + "\n")
 
         ## Iterate over geometry paths getting the nearest each time.
         log.debug("Starting G-Code...")
+
+        # Formatted once; re-used for every tool lift below.
+        lift_code = "G00 Z%.4f\n" % self.z_move
+
         path_count = 0
         current_pt = (0, 0)
         pt, geo = storage.nearest(current_pt)
@@ -3275,9 +3376,9 @@ class CNCjob(Geometry):
                     # Note: self.linear2gcode() and self.point2gcode() will
                     # lower and raise the tool every time.
                     if type(geo) == LineString or type(geo) == LinearRing:
-                        self.gcode += self.linear2gcode(geo, tolerance=tolerance)
+                        gcode.append(self.linear2gcode(geo, tolerance=tolerance))
                     elif type(geo) == Point:
-                        self.gcode += self.point2gcode(geo)
+                        gcode.append(self.point2gcode(geo))
                     else:
                         log.warning("G-code generation not implemented for %s" % (str(type(geo))))
 
@@ -3308,13 +3409,13 @@ class CNCjob(Geometry):
                         # at the first point if the tool is down (in the material).
                         # So, an extra G00 should show up but is inconsequential.
                         if type(geo) == LineString or type(geo) == LinearRing:
-                            self.gcode += self.linear2gcode(geo, tolerance=tolerance,
-                                                            zcut=depth,
-                                                            up=False)
+                            gcode.append(self.linear2gcode(geo, tolerance=tolerance,
+                                                           zcut=depth,
+                                                           up=False))
 
                         # Ignore multi-pass for points.
                         elif type(geo) == Point:
-                            self.gcode += self.point2gcode(geo)
+                            gcode.append(self.point2gcode(geo))
                             break  # Ignoring ...
 
                         else:
@@ -3332,8 +3433,8 @@ class CNCjob(Geometry):
                             geo.coords = list(geo.coords)[::-1]
 
                     # Lift the tool
-                    self.gcode += "G00 Z%.4f\n" % self.z_move
-                    # self.gcode += "( End of path. )\n"
+                    gcode.append(lift_code)
+                    # gcode.append("( End of path. )\n")
 
                 # Did deletion at the beginning.
                 # Delete from index, update current location and continue.
@@ -3351,9 +3452,11 @@ class CNCjob(Geometry):
         log.debug("%s paths traced." % path_count)
 
         # Finish
-        self.gcode += "G00 Z%.4f\n" % self.z_move  # Stop cutting
-        self.gcode += "G00 X0Y0\n"
-        self.gcode += "M05\n"  # Spindle stop
+        gcode.append(lift_code)  # Stop cutting
+        gcode.append("G00 X0Y0\n")
+        gcode.append("M05\n")  # Spindle stop
+
+        self.gcode = "".join(gcode)
 
     @staticmethod
     def codes_split(gline):
@@ -3571,7 +3674,7 @@ class CNCjob(Geometry):
         if feedrate is None:
             feedrate = self.feedrate
 
-        t = "G0%d " + CNCjob.defaults["coordinate_format"] + "\n"
+        t = self.move_template
 
         # Simplify paths?
         if tolerance > 0:
@@ -3597,9 +3700,10 @@ class CNCjob(Geometry):
             else:
                 gcode += "G01 Z%.4f\n" % zcut       # Start cutting
 
-        # Cutting...
-        for pt in path[1:]:
-            gcode += t % (1, pt[0], pt[1])    # Linear motion to point
+        # Cutting... Format all the points and join them in one go;
+        # appending to the string per point is quadratic in the path
+        # length.
+        gcode += "".join([t % (1, pt[0], pt[1]) for pt in path[1:]])
 
         # Up to travelling height.
         if up:
@@ -3610,7 +3714,7 @@ class CNCjob(Geometry):
     def point2gcode(self, point):
         gcode = ""
         #t = "G0%d X%.4fY%.4f\n"
-        t = "G0%d " + CNCjob.defaults["coordinate_format"] + "\n"
+        t = self.move_template
         path = list(point.coords)
         gcode += t % (0, path[0][0], path[0][1])  # Move to first point
 
@@ -3803,10 +3907,10 @@ def get_bounds(geometry_list):
     for gs in geometry_list:
         try:
             gxmin, gymin, gxmax, gymax = gs.bounds()
-            xmin = min([xmin, gxmin])
-            ymin = min([ymin, gymin])
-            xmax = max([xmax, gxmax])
-            ymax = max([ymax, gymax])
+            xmin = min(xmin, gxmin)
+            ymin = min(ymin, gymin)
+            xmax = max(xmax, gxmax)
+            ymax = max(ymax, gymax)
         except:
             log.warning("DEVELOPMENT: Tried to get bounds of empty geometry.")
 
@@ -3836,21 +3940,22 @@ def arc(center, radius, start, stop, direction, steps_per_circ):
     # TODO: Resolution should be established by maximum error from the exact arc.
 
     da_sign = {"cw": -1.0, "ccw": 1.0}
-    points = []
     if direction == "ccw" and stop <= start:
         stop += 2 * pi
     if direction == "cw" and stop >= start:
         stop -= 2 * pi
-    
+
     angle = abs(stop - start)
-        
+
     #angle = stop-start
     steps = max([int(ceil(angle / (2 * pi) * steps_per_circ)), 2])
     delta_angle = da_sign[direction] * angle * 1.0 / steps
-    for i in range(steps + 1):
-        theta = start + delta_angle * i
-        points.append((center[0] + radius * cos(theta), center[1] + radius * sin(theta)))
-    return points
+
+    # Generate all the points in a single NumPy pass instead of
+    # computing each vertex with scalar trigonometry in Python.
+    theta = start + delta_angle * arange(steps + 1)
+    return list(zip(center[0] + radius * cos(theta),
+                    center[1] + radius * sin(theta)))
 
 
 def arc2(p1, p2, center, direction, steps_per_circ):
@@ -4242,7 +4347,10 @@ def three_point_circle(p1, p2, p3):
 
 
 def distance(pt1, pt2):
-    return sqrt((pt1[0] - pt2[0]) ** 2 + (pt1[1] - pt2[1]) ** 2)
+    # math.sqrt is much faster than numpy's on scalars. This runs on
+    # every mouse move while snapping in the editor and in the
+    # tool-lift optimization loops, always on plain floats.
+    return scalar_sqrt((pt1[0] - pt2[0]) ** 2 + (pt1[1] - pt2[1]) ** 2)
 
 
 class FlatCAMRTree(object):
@@ -87,9 +87,16 @@ class TclCommandAlignDrill(TclCommandSignaled):
             return "ERROR: Specify -holes or -grid with -gridoffset "
 
         if 'holes' in args:
+            # Parse "(X1,Y1),(X2,Y2)" with float() rather than eval():
+            # plain numeric conversion, and no way to inject code
+            # through a shell argument.
             try:
-                holes = eval("[" + args['holes'] + "]")
-            except KeyError:
+                holes = [(float(x), float(y))
+                         for x, y in re.findall(r"\(([^,()]+),([^()]+)\)",
+                                                args['holes'])]
+            except ValueError:
+                return "ERROR: Wrong -holes format (X1,Y1),(X2,Y2)"
+            if not holes:
                 return "ERROR: Wrong -holes format (X1,Y1),(X2,Y2)"
 
         xscale, yscale = {"X": (1.0, -1.0), "Y": (-1.0, 1.0)}[axis]
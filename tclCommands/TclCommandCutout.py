@@ -1,5 +1,8 @@
 from tclCommands.TclCommand import *
 
+from numpy import array
+from shapely.geometry import MultiLineString
+
 
 class TclCommandCutout(TclCommand):
     """
@@ -30,6 +33,17 @@ class TclCommandCutout(TclCommand):
     # array of mandatory options for current Tcl command: required = {'name','outname'}
     required = ['name']
 
+    # Indexes into the 12-point cutout perimeter for each gap layout.
+    # Class-level so the table is not rebuilt on every invocation.
+    gap_cases = {"tb": ((0, 1, 4, 5),
+                        (6, 7, 10, 11)),
+                 "lr": ((9, 10, 1, 2),
+                        (3, 4, 7, 8)),
+                 "4": ((0, 1, 2),
+                       (3, 4, 5),
+                       (6, 7, 8),
+                       (9, 10, 11))}
+
     # structured help for current command, args needs to be ordered
     help = {
         'main': 'Creates board cutout.',
@@ -53,6 +67,11 @@ class TclCommandCutout(TclCommand):
 
         name = args['name']
 
+        gaps = args['gaps']
+        if gaps not in self.gap_cases:
+            return "Invalid gaps: %s. Valid values: %s" % \
+                   (gaps, ", ".join(sorted(self.gap_cases)))
+
         try:
             obj = self.app.collection.get_by_name(str(name))
         except:
@@ -69,28 +88,24 @@ class TclCommandCutout(TclCommand):
             midx = 0.5 * (minx + maxx)
             midy = 0.5 * (miny + maxy)
             hgap = 0.5 * gap_size
-            pts = [[midx - hgap, maxy],
-                   [minx, maxy],
-                   [minx, midy + hgap],
-                   [minx, midy - hgap],
-                   [minx, miny],
-                   [midx - hgap, miny],
-                   [midx + hgap, miny],
-                   [maxx, miny],
-                   [maxx, midy - hgap],
-                   [maxx, midy + hgap],
-                   [maxx, maxy],
-                   [midx + hgap, maxy]]
-            cases = {"tb": [[pts[0], pts[1], pts[4], pts[5]],
-                            [pts[6], pts[7], pts[10], pts[11]]],
-                     "lr": [[pts[9], pts[10], pts[1], pts[2]],
-                            [pts[3], pts[4], pts[7], pts[8]]],
-                     "4": [[pts[0], pts[1], pts[2]],
-                           [pts[3], pts[4], pts[5]],
-                           [pts[6], pts[7], pts[8]],
-                           [pts[9], pts[10], pts[11]]]}
-            cuts = cases[args['gaps']]
-            geo_obj.solid_geometry = cascaded_union([LineString(segment) for segment in cuts])
+            pts = array([[midx - hgap, maxy],
+                         [minx, maxy],
+                         [minx, midy + hgap],
+                         [minx, midy - hgap],
+                         [minx, miny],
+                         [midx - hgap, miny],
+                         [midx + hgap, miny],
+                         [maxx, miny],
+                         [maxx, midy - hgap],
+                         [maxx, midy + hgap],
+                         [maxx, maxy],
+                         [midx + hgap, maxy]])
+            # Segments are picked out of the point array by index.
+            cuts = [pts[list(indexes)]
+                    for indexes in self.gap_cases[gaps]]
+            # The segments are disjoint by construction; wrapping them in a
+            # MultiLineString avoids the GEOS union pass.
+            geo_obj.solid_geometry = MultiLineString(cuts)
 
         try:
             obj.app.new_object("geometry", name + "_cutout", geo_init_me)
@@ -1,5 +1,8 @@
 from tclCommands.TclCommand import *
 
+from shapely.geometry import box
+from shapely.ops import cascaded_union
+
 
 class TclCommandGeoCutout(TclCommandSignaled):
     """
@@ -27,6 +30,9 @@ class TclCommandGeoCutout(TclCommandSignaled):
     # array of mandatory options for current Tcl command: required = {'name','outname'}
     required = ['name']
 
+    # Accepted -gaps values; class-level so the set is built once.
+    valid_gaps = frozenset(['lr', 'tb', '4', '2lr', '2tb', '8'])
+
     # structured help for current command, args needs to be ordered
     help = {
         'main': "Cut holding gaps from geometry.",
@@ -59,11 +65,20 @@ class TclCommandGeoCutout(TclCommandSignaled):
         # 8     - 2*left + 2*right +2*top + 2*bottom
 
         name = args['name']
+        gaps = args['gaps']
         obj = None
 
+        if gaps not in self.valid_gaps:
+            self.raise_tcl_error("Invalid gaps: %s. Valid values: %s" %
+                                 (gaps, ", ".join(sorted(self.valid_gaps))))
+
+        # Collect all the gap rectangles first and subtract their union
+        # in a single pass, instead of flattening and re-building the
+        # object geometry once per rectangle.
+        cutouts = []
+
         def subtract_rectangle(obj_, x0, y0, x1, y1):
-            pts = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
-            obj_.subtract_polygon(pts)
+            cutouts.append(box(x0, y0, x1, y1))
 
         try:
             obj = self.app.collection.get_by_name(str(name))
@@ -78,7 +93,7 @@ class TclCommandGeoCutout(TclCommandSignaled):
         lenghty = (ymax - ymin)
         gapsize = args['gapsize'] + args['dia'] / 2
 
-        if args['gaps'] == '8' or args['gaps'] == '2lr':
+        if gaps == '8' or gaps == '2lr':
             subtract_rectangle(obj,
                                xmin - gapsize,  # botleft_x
                                py - gapsize + lenghty / 4,  # botleft_y
@@ -90,7 +105,7 @@ class TclCommandGeoCutout(TclCommandSignaled):
                                xmax + gapsize,
                                py + gapsize - lenghty / 4)
 
-        if args['gaps'] == '8' or args['gaps'] == '2tb':
+        if gaps == '8' or gaps == '2tb':
             subtract_rectangle(obj,
                                px - gapsize + lenghtx / 4,
                                ymin - gapsize,
@@ -102,16 +117,19 @@ class TclCommandGeoCutout(TclCommandSignaled):
                                px + gapsize - lenghtx / 4,
                                ymax + gapsize)
 
-        if args['gaps'] == '4' or args['gaps'] == 'lr':
+        if gaps == '4' or gaps == 'lr':
             subtract_rectangle(obj,
                                xmin - gapsize,
                                py - gapsize,
                                xmax + gapsize,
                                py + gapsize)
 
-        if args['gaps'] == '4' or args['gaps'] == 'tb':
+        if gaps == '4' or gaps == 'tb':
             subtract_rectangle(obj,
                                px - gapsize,
                                ymin - gapsize,
                                px + gapsize,
                                ymax + gapsize)
+
+        if cutouts:
+            obj.subtract_geometry(cascaded_union(cutouts))
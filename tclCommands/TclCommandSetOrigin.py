@@ -0,0 +1,92 @@
+from tclCommands.TclCommand import *
+
+
+class TclCommandSetOrigin(TclCommand):
+    """
+    Tcl shell command to set the origin of the project by offsetting
+    all loaded objects.
+
+    example:
+        set_origin 1.2,-0.3
+        set_origin -auto 1
+    """
+
+    # List of all command aliases, to be able use old names for backward compatibility (add_poly, add_polygon)
+    aliases = ['set_origin']
+
+    # Dictionary of types from Tcl command, needs to be ordered
+    arg_names = collections.OrderedDict([
+        ('loc', str)
+    ])
+
+    # Dictionary of types from Tcl command, needs to be ordered , this  is  for options  like -optionname value
+    option_types = collections.OrderedDict([
+        ('auto', int)
+    ])
+
+    # array of mandatory options for current Tcl command: required = {'name','outname'}
+    required = []
+
+    # Messages used by execute(); bound once at class load instead of
+    # being rebuilt on every invocation.
+    msg_ok = '[success] Origin set by offsetting all loaded objects with '
+    msg_bad = 'Expected a pair of (x, y) coordinates. Got '
+    msg_noop = '[success] Origin unchanged: nothing to offset.'
+
+    # structured help for current command, args needs to be ordered
+    help = {
+        'main': "Sets the origin by offsetting all loaded objects.",
+        'args': collections.OrderedDict([
+            ('loc', 'Offset to apply as a pair of x,y coordinates.'),
+            ('auto', 'If 1, moves the bottom left corner of the bounding '
+                     'box of all objects to the origin.')
+        ]),
+        'examples': ['set_origin 1.2,-0.3', 'set_origin -auto 1']
+    }
+
+    def execute(self, args, unnamed_args):
+        """
+
+        :param args:
+        :param unnamed_args:
+        :return:
+        """
+
+        objs = self.app.collection.get_list()
+
+        # With nothing loaded there is nothing to offset (and the
+        # -auto bounds would be infinite).
+        if not objs:
+            self.app.inform.emit(self.msg_noop)
+            return
+
+        if args.get('auto') == 1:
+            xmin, ymin = self.app.collection.get_bounds()[:2]
+            loc = [-xmin, -ymin]
+        elif 'loc' in args:
+            # Plain float() parsing: no eval(), so arbitrary expressions
+            # are rejected and the hot path stays a C-level conversion.
+            # partition() splits the pair without building a list.
+            x_str, sep, y_str = str(args['loc']).partition(',')
+            try:
+                if not sep or ',' in y_str:
+                    raise ValueError
+                loc = (float(x_str), float(y_str))
+            except ValueError:
+                self.raise_tcl_error(self.msg_bad + str(args['loc']))
+                return
+        else:
+            self.raise_tcl_error("Expected -auto 1 or a pair of (x, y) "
+                                 "coordinates.")
+            return
+
+        # Skip the whole translation pass (and redraws) when the
+        # offset is a no-op, as on repeated -auto calls.
+        if abs(loc[0]) < 1e-12 and abs(loc[1]) < 1e-12:
+            self.app.inform.emit(self.msg_noop)
+            return
+
+        for obj in objs:
+            obj.offset((loc[0], loc[1]))
+
+        self.app.inform.emit(self.msg_ok + '%.4f, %.4f' % (loc[0], loc[1]))
@@ -0,0 +1,49 @@
+from FlatCAMObj import FlatCAMGeometry
+
+
+def test_set_origin(self):
+    """
+    Test offsetting all objects by an explicit location
+    :param self:
+    :return:
+    """
+
+    self.fc.exec_command_test('new_geometry "%s"' % self.geometry_name)
+    geometry_obj = self.fc.collection.get_by_name(self.geometry_name)
+    self.assertTrue(isinstance(geometry_obj, FlatCAMGeometry), "Expected FlatCAMGeometry, instead, %s is %s"
+                    % (self.geometry_name, type(geometry_obj)))
+
+    points = '0 0 10 0 10 10 0 10'
+    self.fc.exec_command_test('add_polygon "%s" %s' % (self.geometry_name, points))
+
+    self.fc.exec_command_test('set_origin 3,2')
+
+    xmin, ymin, xmax, ymax = geometry_obj.bounds()
+    self.assertAlmostEqual(xmin, 3.0)
+    self.assertAlmostEqual(ymin, 2.0)
+    self.assertAlmostEqual(xmax, 13.0)
+    self.assertAlmostEqual(ymax, 12.0)
+
+
+def test_set_origin_auto(self):
+    """
+    Test moving the bounding box of all objects to the origin
+    :param self:
+    :return:
+    """
+
+    self.fc.exec_command_test('new_geometry "%s"' % self.geometry_name)
+    geometry_obj = self.fc.collection.get_by_name(self.geometry_name)
+    self.assertTrue(isinstance(geometry_obj, FlatCAMGeometry), "Expected FlatCAMGeometry, instead, %s is %s"
+                    % (self.geometry_name, type(geometry_obj)))
+
+    points = '2 3 12 3 12 13 2 13'
+    self.fc.exec_command_test('add_polygon "%s" %s' % (self.geometry_name, points))
+
+    self.fc.exec_command_test('set_origin -auto 1')
+
+    xmin, ymin, xmax, ymax = geometry_obj.bounds()
+    self.assertAlmostEqual(xmin, 0.0)
+    self.assertAlmostEqual(ymin, 0.0)
+    self.assertAlmostEqual(xmax, 10.0)
+    self.assertAlmostEqual(ymax, 10.0)